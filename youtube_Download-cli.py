@@ -1,9 +1,21 @@
+import asyncio
 import subprocess
 import json
+import hashlib
+import shutil
+import signal
 import sys
 import os
-import re
-from typing import List, Dict, Optional, Set
+import time
+from typing import List, Dict, Optional, Union
+
+# Prefer orjson's SIMD-accelerated parser when available; fall back to the
+# stdlib. Both accept the raw bytes that the subprocess pipe yields.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # UI Constants
 APP_TITLE = "============================================"
@@ -29,6 +41,123 @@ ERROR_INVALID_NUMBER = "Invalid number. Please enter a valid number from the lis
 ERROR_INVALID_INPUT = "Invalid input. Please use numbers or 'all'."
 ERROR_NO_SELECTION = "No videos selected. Please try again."
 
+# Download Settings
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Resolve yt-dlp to an absolute path once; spawning with it skips the PATH
+# scan (a stat per PATH entry) that posix_spawnp would otherwise repeat for
+# every subprocess. Falls back to the bare name if not found at import time.
+YT_DLP = shutil.which("yt-dlp") or "yt-dlp"
+
+# Live download processes, tracked so an interrupt can kill whole process
+# groups (yt-dlp plus any ffmpeg children) instead of orphaning them.
+_active_downloads = set()
+
+# On POSIX each download gets its own session so killpg reaches ffmpeg too
+_DOWNLOAD_SPAWN_KWARGS = {'start_new_session': True} if os.name == 'posix' else {}
+
+
+def _kill_active_downloads() -> None:
+    """Terminates every live download's whole process group."""
+    for process in list(_active_downloads):
+        if process.returncode is not None:
+            continue
+        try:
+            if os.name == 'posix':
+                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+            else:
+                process.terminate()
+        except (OSError, ProcessLookupError):
+            pass  # The process may have exited on its own
+
+
+# Cache directory for dependency markers and playlist metadata
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "youtube-playlist-dl")
+
+# How long a cached playlist fetch stays valid, in seconds
+PLAYLIST_CACHE_TTL = 6 * 60 * 60
+
+
+def _playlist_cache_path(url: str) -> str:
+    """Returns the on-disk cache path for a playlist URL."""
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+
+def _load_cached_playlist(url: str) -> Optional[List[Dict[str, str]]]:
+    """
+    Loads a previously fetched playlist from the disk cache.
+
+    Args:
+        url: The YouTube playlist URL
+
+    Returns:
+        The cached video list if present and within PLAYLIST_CACHE_TTL,
+        otherwise None
+    """
+    try:
+        with open(_playlist_cache_path(url), "rb") as cache_file:
+            cached = _json_loads(cache_file.read())
+        if time.time() - cached['fetched_at'] <= PLAYLIST_CACHE_TTL:
+            return cached['videos']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing or corrupt cache entries simply force a re-fetch
+    return None
+
+
+def _store_cached_playlist(url: str, videos: List[Dict[str, str]]) -> None:
+    """
+    Writes a fetched playlist to the disk cache atomically.
+
+    Args:
+        url: The YouTube playlist URL
+        videos: The fetched video list to cache
+    """
+    cache_path = _playlist_cache_path(url)
+    tmp_path = cache_path + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w") as cache_file:
+            cache_file.write(json.dumps({'fetched_at': time.time(), 'videos': videos}))
+        os.replace(tmp_path, cache_path)  # Atomic publish
+    except OSError:
+        pass  # The cache is best-effort; the fetch already succeeded
+
+
+def _prompt(prompt_text: str) -> Optional[str]:
+    """
+    Reads one line of user input via sys.stdin.readline.
+
+    Unlike input(), readline drains large pastes (e.g. a comma list of
+    thousands of indices) straight from stdin's buffer instead of feeding
+    them through the interactive line editor one chunk at a time.
+
+    Args:
+        prompt_text: Text to display before reading
+
+    Returns:
+        The entered line without its trailing newline, or None on EOF
+    """
+    sys.stdout.write(prompt_text)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        return None  # EOF
+    return line.rstrip('\n')
+
+
+def check_ytdlp_installed() -> bool:
+    """
+    Checks that yt-dlp is installed.
+
+    A PATH scan via shutil.which is enough here — it avoids spawning a
+    Python interpreter just to print a version string. If the binary turns
+    out to be broken, the first real invocation reports the failure.
+
+    Returns:
+        True if yt-dlp is available, False otherwise
+    """
+    return shutil.which("yt-dlp") is not None
+
 # User Prompts
 PROMPT_PLAYLIST_URL = "\nEnter YouTube Playlist URL (or 'exit' to quit): "
 PROMPT_SELECTION = "\nEnter the number(s) to download (e.g., 1, 5, 8-10) or 'all': "
@@ -41,11 +170,13 @@ MSG_DOWNLOAD_FAILED = "Download of '{}' failed."
 
 def main() -> None:
     """Main function to run the command-line interface."""
-    
+
+    # With --all the user pre-commits to downloading every video, so the
+    # fetch and download stages can be fused instead of run back to back.
+    download_everything = '--all' in sys.argv[1:]
+
     # Check if yt-dlp is installed
-    try:
-        subprocess.run(["yt-dlp", "--version"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    except (FileNotFoundError, subprocess.CalledProcessError):
+    if not check_ytdlp_installed():
         print(ERROR_YTDLP_NOT_FOUND)
         print(ERROR_YTDLP_INSTALL_MSG)
         sys.exit(1)
@@ -55,11 +186,20 @@ def main() -> None:
     print(APP_TITLE)
     
     while True:
-        playlist_url = input(PROMPT_PLAYLIST_URL)
-        if playlist_url.lower() == 'exit':
+        playlist_url = _prompt(PROMPT_PLAYLIST_URL)
+        if playlist_url is None or playlist_url.lower() == 'exit':
             break
 
         print(MSG_FETCHING)
+
+        if download_everything:
+            try:
+                asyncio.run(_fetch_and_download_all(playlist_url))
+            except KeyboardInterrupt:
+                _kill_active_downloads()
+                raise
+            continue
+
         videos = fetch_playlist_info(playlist_url)
 
         if videos:
@@ -69,42 +209,46 @@ def main() -> None:
         else:
             print(ERROR_NO_VIDEOS)
 
-def fetch_playlist_info(url: str) -> List[Dict[str, str]]:
+async def _fetch_playlist_info_async(url: str) -> List[Dict[str, str]]:
     """
-    Fetches video titles and URLs from a YouTube playlist.
-    
+    Asynchronously fetches video titles and URLs from a YouTube playlist.
+
+    Reading yt-dlp's output through asyncio lets the JSON parsing overlap
+    with yt-dlp's own network I/O instead of blocking on each readline.
+
     Args:
         url: The YouTube playlist URL
-        
+
     Returns:
         A list of dictionaries containing 'title' and 'url' for each video,
         or an empty list if an error occurs
     """
     try:
-        command = [
-            "yt-dlp",
+        process = await asyncio.create_subprocess_exec(
+            YT_DLP,
             "--flat-playlist",
             "-j",
             "--no-warnings",  # Hide warnings for a cleaner output
-            url
-        ]
-        
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            url,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=1 << 20  # Allow long metadata lines without overflow
+        )
 
         video_info_list = []
-        for line in iter(process.stdout.readline, ''):
+        async for line in process.stdout:
             if line.strip():
                 try:
-                    video_json = json.loads(line)
+                    video_json = _json_loads(line)
                     video_info_list.append({
                         'title': video_json['title'],
                         'url': video_json['url']
                     })
-                except json.JSONDecodeError:
+                except ValueError:
                     pass  # Ignore lines that are not valid JSON
-        
-        return_code = process.wait()
-        
+
+        return_code = await process.wait()
+
         # Return videos only if the process completed successfully
         if return_code == 0:
             return video_info_list
@@ -116,48 +260,95 @@ def fetch_playlist_info(url: str) -> List[Dict[str, str]]:
         print(ERROR_FETCH_INFO.format(e))
         return []
 
-def parse_selection_input(selection_input: str, max_index: int) -> Optional[Set[int]]:
+
+def fetch_playlist_info(url: str) -> List[Dict[str, str]]:
     """
-    Parses user selection input into a set of indices.
-    
+    Fetches video titles and URLs from a YouTube playlist.
+
+    Args:
+        url: The YouTube playlist URL
+
+    Returns:
+        A list of dictionaries containing 'title' and 'url' for each video,
+        or an empty list if an error occurs
+
+    Results are cached on disk for PLAYLIST_CACHE_TTL so re-running the CLI
+    on the same playlist skips the full yt-dlp fetch.
+    """
+    cached = _load_cached_playlist(url)
+    if cached is not None:
+        return cached
+
+    videos = asyncio.run(_fetch_playlist_info_async(url))
+    if videos:
+        _store_cached_playlist(url, videos)
+    return videos
+
+def parse_selection_input(selection_input: str, max_index: int) -> Optional[bytearray]:
+    """
+    Parses user selection input into an index bitmap.
+
+    A bytearray of one flag per index is far lighter than a set of ints for
+    big playlists, and range selections become a single slice assignment
+    instead of thousands of set inserts.
+
     Args:
         selection_input: User input string (e.g., "1, 5, 8-10")
         max_index: Maximum valid index
-        
+
     Returns:
-        A set of valid indices (1-based), or None if input is invalid
+        A bytearray of max_index + 1 flags where flag i is set when video i
+        (1-based) is selected, or None if input is invalid
     """
-    selected_indices = set()
-    parts = re.split(r'[,\s]+', selection_input)
-    
-    for part in parts:
-        if not part:
+    selected = bytearray(max_index + 1)
+    n = len(selection_input)
+    i = 0
+
+    # Single pass: skip separators, read digit runs, mark the bitmap. No
+    # regex split and no intermediate part list.
+    while i < n:
+        char = selection_input[i]
+        if char == ',' or char.isspace():
+            i += 1
             continue
-        
-        if '-' in part:
-            try:
-                start, end = map(int, part.split('-'))
-                if 1 <= start <= end <= max_index:
-                    selected_indices.update(range(start, end + 1))
-                else:
-                    print(ERROR_INVALID_RANGE)
-                    return None
-            except ValueError:
+
+        # Read the first number of the part. Compare against '0'..'9'
+        # directly: str.isdigit also accepts characters like superscripts
+        # that int() rejects, which would raise instead of re-prompting
+        j = i
+        while j < n and '0' <= selection_input[j] <= '9':
+            j += 1
+        if j == i:
+            print(ERROR_INVALID_INPUT)
+            return None
+        start = int(selection_input[i:j])
+
+        if j < n and selection_input[j] == '-':
+            # Range: read the closing number after the dash
+            k = j + 1
+            m = k
+            while m < n and '0' <= selection_input[m] <= '9':
+                m += 1
+            if m == k:
                 print(ERROR_INVALID_RANGE_FORMAT)
                 return None
+            end = int(selection_input[k:m])
+            if 1 <= start <= end <= max_index:
+                # One memmove marks the whole range
+                selected[start:end + 1] = b'\x01' * (end - start + 1)
+            else:
+                print(ERROR_INVALID_RANGE)
+                return None
+            i = m
         else:
-            try:
-                index = int(part)
-                if 1 <= index <= max_index:
-                    selected_indices.add(index)
-                else:
-                    print(ERROR_INVALID_NUMBER)
-                    return None
-            except ValueError:
-                print(ERROR_INVALID_INPUT)
+            if 1 <= start <= max_index:
+                selected[start] = 1
+            else:
+                print(ERROR_INVALID_NUMBER)
                 return None
-    
-    return selected_indices
+            i = j
+
+    return selected
 
 
 def prompt_for_selection(video_list: List[Dict[str, str]]) -> Optional[List[Dict[str, str]]]:
@@ -171,54 +362,197 @@ def prompt_for_selection(video_list: List[Dict[str, str]]) -> Optional[List[Dict
         List of selected videos, or None if cancelled
     """
     print(VIDEOS_HEADER)
+    # Build the row template once; a dynamic width inside an f-string would
+    # re-parse the format spec on every iteration (and the fixed width used
+    # before misaligned playlists past 99 entries).
+    index_width = len(str(len(video_list)))
+    row_format = f"[{{:{index_width}}}] {{}}".format
     for i, video in enumerate(video_list, 1):
-        print(f"[{i:2}] {video['title']}")
+        print(row_format(i, video['title']))
     print(DIVIDER)
     
     while True:
-        selection_input = input(PROMPT_SELECTION).strip().lower()
-        
+        selection_input = _prompt(PROMPT_SELECTION)
+        if selection_input is None:
+            return None
+        selection_input = selection_input.strip().lower()
+
         if selection_input == 'all':
             return video_list
 
-        selected_indices = parse_selection_input(selection_input, len(video_list))
-        
-        if selected_indices:
-            return [video_list[i-1] for i in sorted(selected_indices)]
-        elif selected_indices is not None:
-            # Empty set - valid input but no videos selected
+        selected = parse_selection_input(selection_input, len(video_list))
+
+        if selected is not None:
+            if any(selected):
+                # Single pass over the playlist keeps the original order and
+                # reads each selection flag straight out of the bitmap.
+                return [video for i, video in enumerate(video_list, 1) if selected[i]]
+            # Empty bitmap - valid input but no videos selected
             print(ERROR_NO_SELECTION)
 
-def download_videos(videos_to_download: List[Dict[str, str]]) -> None:
+async def _download_one(
+    video: Dict[str, str],
+    index: int,
+    total: Union[int, str],
+    print_lock: asyncio.Lock
+) -> None:
     """
-    Downloads the selected videos using yt-dlp.
-    
+    Downloads a single video, serializing console output via print_lock.
+
     Args:
-        videos_to_download: List of video dictionaries with 'title' and 'url'
+        video: Video dictionary with 'title' and 'url'
+        index: 1-based position of this video in the selection
+        total: Total number of videos being downloaded, or '?' when the
+            playlist is still being fetched
+        print_lock: Lock shared by all downloads to keep output readable
     """
-    for i, video in enumerate(videos_to_download, 1):
-        print(MSG_DOWNLOAD_START.format(i, len(videos_to_download), video['title']))
-        
-        try:
-            command = ["yt-dlp", "--progress", video['url']]
-            
-            # Use Popen to show real-time progress
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            
-            for line in iter(process.stdout.readline, ''):
-                sys.stdout.write(line)
-            sys.stdout.flush()
-            
-            # Wait for the process to complete
-            process.wait()
-            
+    async with print_lock:
+        print(MSG_DOWNLOAD_START.format(index, total, video['title']))
+        sys.stdout.flush()  # Progress below bypasses the stdout buffer
+
+    process = None
+    try:
+        process = await asyncio.create_subprocess_exec(
+            YT_DLP,
+            "--progress",
+            video['url'],
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=1 << 20,
+            **_DOWNLOAD_SPAWN_KWARGS
+        )
+        _active_downloads.add(process)
+
+        # Relay yt-dlp's output as raw bytes in large chunks. Decoding to
+        # str only to re-encode for the terminal costs a round trip per
+        # line, and os.write on fd 1 skips the TextIOWrapper buffer (and
+        # with it any need for flush throttling).
+        while True:
+            chunk = await process.stdout.read(65536)
+            if not chunk:
+                break
+            async with print_lock:
+                os.write(1, chunk)
+
+        # Wait for the process to complete
+        await process.wait()
+
+        async with print_lock:
             if process.returncode == 0:
                 print(MSG_DOWNLOAD_SUCCESS.format(video['title']))
             else:
                 print(MSG_DOWNLOAD_FAILED.format(video['title']))
-                
-        except Exception as e:
+            sys.stdout.flush()
+
+    except Exception as e:
+        async with print_lock:
             print(ERROR_DOWNLOAD.format(e))
+    finally:
+        if process is not None:
+            _active_downloads.discard(process)
+
+
+async def _download_videos_async(videos_to_download: List[Dict[str, str]]) -> None:
+    """
+    Runs up to MAX_CONCURRENT_DOWNLOADS yt-dlp downloads concurrently.
+
+    Args:
+        videos_to_download: List of video dictionaries with 'title' and 'url'
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    print_lock = asyncio.Lock()
+    total = len(videos_to_download)
+
+    async def bounded(video: Dict[str, str], index: int) -> None:
+        async with semaphore:
+            await _download_one(video, index, total, print_lock)
+
+    await asyncio.gather(
+        *(bounded(video, i) for i, video in enumerate(videos_to_download, 1))
+    )
+
+
+async def _fetch_and_download_all(url: str) -> None:
+    """
+    Fuses playlist fetching and downloading for a pre-committed 'all' run.
+
+    Parsed entries are queued as yt-dlp emits them, so the download workers
+    start on the first video while the rest of the playlist is still being
+    fetched, overlapping the fetch with download network time.
+
+    Args:
+        url: The YouTube playlist URL
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    print_lock = asyncio.Lock()
+
+    async def produce() -> None:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                YT_DLP,
+                "--flat-playlist",
+                "-j",
+                "--no-warnings",
+                url,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=1 << 20
+            )
+            index = 0
+            async for line in process.stdout:
+                if not line.strip():
+                    continue
+                try:
+                    video_json = _json_loads(line)
+                    index += 1
+                    await queue.put((index, {
+                        'title': video_json['title'],
+                        'url': video_json['url']
+                    }))
+                except ValueError:
+                    pass  # Ignore lines that are not valid JSON
+            await process.wait()
+            if index == 0:
+                async with print_lock:
+                    print(ERROR_NO_VIDEOS)
+        except (OSError, subprocess.SubprocessError) as e:
+            async with print_lock:
+                print(ERROR_FETCH_INFO.format(e))
+        finally:
+            await queue.put(None)
+
+    async def worker() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                queue.put_nowait(None)  # Pass the sentinel on to peer workers
+                return
+            index, video = item
+            await _download_one(video, index, '?', print_lock)
+
+    await asyncio.gather(
+        produce(),
+        *(worker() for _ in range(MAX_CONCURRENT_DOWNLOADS))
+    )
+
+
+def download_videos(videos_to_download: List[Dict[str, str]]) -> None:
+    """
+    Downloads the selected videos using yt-dlp.
+
+    Downloads are independent network-bound work, so they run concurrently
+    under a semaphore instead of one at a time.
+
+    Args:
+        videos_to_download: List of video dictionaries with 'title' and 'url'
+    """
+    try:
+        asyncio.run(_download_videos_async(videos_to_download))
+    except KeyboardInterrupt:
+        # Take the whole process group down so ffmpeg children don't keep
+        # hammering the disk after the user bails out.
+        _kill_active_downloads()
+        raise
 
 
 if __name__ == "__main__":
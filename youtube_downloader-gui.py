@@ -1,15 +1,97 @@
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import customtkinter as ctk
 import subprocess
 import threading
-import json
 import os
+import shutil
+import signal
 import sys
 import re
 
+# Upper bound on yt-dlp processes running at once; queued downloads wait in
+# the executor until a slot frees up. Sized from the machine — half the
+# cores, clamped to 2..6 so small boxes still overlap network waits and big
+# ones don't swamp the link or the disk.
+MAX_CONCURRENT_DOWNLOADS = min(max(2, (os.cpu_count() or 2) // 2), 6)
+
+# Absolute path to yt-dlp, resolved once at import so every spawn skips the
+# PATH search; falls back to the bare name if it isn't installed yet
+YT_DLP = shutil.which("yt-dlp") or "yt-dlp"
+
+# Success indicators that may appear in yt-dlp output even when the exit
+# code is non-zero. All four are plain literals, so bytes' fastsearch-based
+# `in` beats dispatching a regex engine over the output. Output lines are
+# handled as raw bytes and only decoded when something is shown to the
+# user, so all the hot-path matching below works on bytes.
+SUCCESS_TOKENS = (
+    b'[download] 100%',              # Explicit 100% download
+    b'[ExtractAudio] Destination:',  # Audio extracted
+    b'[ffmpeg] Destination:',        # ffmpeg conversion/merge
+    b'[Merger] Merging formats into',  # Video/audio merged
+)
+
+# Machine-readable progress lines requested from yt-dlp via
+# --progress-template; a fixed prefix plus a '|' separator means the hot
+# path is a startswith + partition with no regex at all
+PROGRESS_PREFIX = b'download:'
+PROGRESS_TEMPLATE = 'download:%(progress._percent)s|%(progress.status)s'
+
+# Non-progress lines worth surfacing in the status label
+KEYWORD_REGEX = re.compile(rb'error|warning|destination|merging', re.IGNORECASE)
+# On POSIX each yt-dlp runs in its own process group so that cancelling can
+# signal the whole group at once — plain terminate() would leave any ffmpeg
+# children yt-dlp spawned still running. Downloads are also deprioritized
+# (nice +10 / below-normal class) so N parallel yt-dlps don't starve the Tk
+# event loop of CPU.
+if os.name == 'posix':
+    _DOWNLOAD_SPAWN_KWARGS = {
+        'start_new_session': True,
+        'preexec_fn': lambda: os.nice(10),
+    }
+elif os.name == 'nt':
+    _DOWNLOAD_SPAWN_KWARGS = {'creationflags': subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+else:
+    _DOWNLOAD_SPAWN_KWARGS = {}
+
+
+def _terminate_download(process):
+    """Stops a download process together with any children it spawned."""
+    try:
+        if os.name == 'posix':
+            os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+        else:
+            process.terminate()
+    except (ProcessLookupError, OSError):
+        pass # Already exited
+
+
+def _force_kill_download(process):
+    """Escalates to SIGKILL for a download that ignored the earlier SIGTERM."""
+    if process.poll() is not None:
+        return # Exited on its own; nothing to escalate
+    try:
+        if os.name == 'posix':
+            os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, OSError):
+        pass # Died between the poll and the kill
+
 # Main application class
 class YouTubeDownloaderApp(ctk.CTk):
+    # Shared font specs; reused across every widget instead of rebuilding a
+    # tuple (and re-hitting Tk's font cache) per widget creation
+    FONT_HEADER = ("Arial", 14)
+    FONT_TITLE = ("Arial", 12)
+    FONT_BTN = ("Arial", 12, "bold")
+    FONT_SM = ("Arial", 10)
+    FONT_SM_BOLD = ("Arial", 10, "bold")
+    FONT_XS = ("Arial", 9)
+
     def __init__(self):
         super().__init__()
 
@@ -24,20 +106,72 @@ class YouTubeDownloaderApp(ctk.CTk):
         self.video_info_list = []    # Holds metadata for videos in the current playlist
         self.is_fetching = False     # Flag to prevent multiple fetch operations
         self.download_path = os.getcwd() # Set default download path to current directory
+        # Recomputed only when the download path changes, not per download
+        self._output_template = os.path.join(self.download_path, "%(title)s.%(ext)s")
+
+        # Bounded worker pool so "Download All" on a large playlist doesn't
+        # spawn one thread + yt-dlp process per video at once
+        self.executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_DOWNLOADS,
+            thread_name_prefix="download"
+        )
+
+        # Pending/running pool jobs (video_url: Future). Jobs queued behind
+        # the pool's worker slots have no subprocess yet, so the cancel
+        # paths need the future to stop them before they ever spawn yt-dlp
+        self.download_futures = {}
+
+        # Latest pending UI state per video (video_url: dict of field: value),
+        # drained by the periodic _flush_ui_updates loop. The lock covers the
+        # writer's get-then-update against the flusher's popitem; it is held
+        # only for dict ops, never across Tcl calls
+        self.pending_ui_updates = {}
+        self._pending_lock = threading.Lock()
 
         # --- GUI Elements ---
         self.create_widgets()
 
+        # Pool workers are non-daemon threads and their atexit hook drains
+        # the queue, so without this closing the window mid-download would
+        # keep the process alive — and still-queued jobs would spawn yt-dlp
+        # after the window is gone
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Python-side mirrors of the global button/status state so the
+        # monitor loop compares plain booleans instead of cget() calls that
+        # each cross the Tcl boundary
+        self._dl_all_enabled = False
+        self._cancel_all_enabled = False
+        self._status_is_cancelling = False
+        # Count of downloads submitted but not yet finished; lets button
+        # state be derived without asking any widget for its state
+        self._active_download_count = 0
+
+        # Last progress value queued per video; sub-1% changes are dropped
+        # before they ever reach the UI flush
+        self._last_progress = {}
+
         # --- Start monitoring downloads ---
-        # This function will periodically check the status of all active downloads
+        # This function will periodically check the status of all active
+        # downloads; it parks itself when none are running and is restarted
+        # by start_single_download
+        self._monitor_running = True
         self.after(100, self.monitor_downloads)
 
+        # --- Start the UI update flusher ---
+        # Download threads queue widget updates; one repeating flush applies
+        # them instead of scheduling an after(0) callback per output line.
+        # The loop parks itself when there is nothing to do and is restarted
+        # by start_single_download.
+        self._flush_running = True
+        self.after(100, self._flush_ui_updates)
+
     def create_widgets(self):
         # Header Frame: Contains URL input and Load button
         header_frame = ctk.CTkFrame(self, fg_color="transparent")
         header_frame.pack(pady=10, fill=tk.X)
 
-        ctk.CTkLabel(header_frame, text="Playlist URL:", font=("Arial", 14)).pack(side=tk.LEFT, padx=5)
+        ctk.CTkLabel(header_frame, text="Playlist URL:", font=self.FONT_HEADER).pack(side=tk.LEFT, padx=5)
 
         self.url_entry = ctk.CTkEntry(header_frame, width=500)
         self.url_entry.pack(side=tk.LEFT, padx=5, expand=True)
@@ -46,7 +180,7 @@ class YouTubeDownloaderApp(ctk.CTk):
             header_frame,
             text="Load Playlist",
             command=self.start_fetch_thread,
-            font=("Arial", 12, "bold")
+            font=self.FONT_BTN
         )
         self.load_button.pack(side=tk.LEFT, padx=5)
 
@@ -54,20 +188,20 @@ class YouTubeDownloaderApp(ctk.CTk):
         path_frame = ctk.CTkFrame(self, fg_color="transparent")
         path_frame.pack(pady=5, fill=tk.X, padx=10)
         
-        self.path_label = ctk.CTkLabel(path_frame, text=f"Save to: {self.download_path}", font=("Arial", 10), text_color="gray")
+        self.path_label = ctk.CTkLabel(path_frame, text=f"Save to: {self.download_path}", font=self.FONT_SM, text_color="gray")
         self.path_label.pack(side=tk.LEFT, padx=5, expand=True)
         
         self.path_button = ctk.CTkButton(
             path_frame,
             text="Change Folder",
             command=self.select_download_path,
-            font=("Arial", 10, "bold"),
+            font=self.FONT_SM_BOLD,
             width=120
         )
         self.path_button.pack(side=tk.LEFT, padx=5)
 
         # Status Label: Displays general application status (e.g., fetching, ready, error)
-        self.status_label = ctk.CTkLabel(self, text="Paste a playlist URL and click 'Load Playlist'.", font=("Arial", 12))
+        self.status_label = ctk.CTkLabel(self, text="Paste a playlist URL and click 'Load Playlist'.", font=self.FONT_TITLE)
         self.status_label.pack(pady=10)
 
         # Video List Frame (Scrollable): Holds individual video entries
@@ -83,7 +217,7 @@ class YouTubeDownloaderApp(ctk.CTk):
             text="Download All",
             command=self.download_all,
             state=tk.DISABLED,
-            font=("Arial", 12, "bold")
+            font=self.FONT_BTN
         )
         self.download_all_button.pack(side=tk.LEFT, padx=10)
 
@@ -94,7 +228,7 @@ class YouTubeDownloaderApp(ctk.CTk):
             state=tk.DISABLED,
             fg_color="red",
             hover_color="#c70000",
-            font=("Arial", 12, "bold")
+            font=self.FONT_BTN
         )
         self.cancel_all_button.pack(side=tk.LEFT, padx=10)
 
@@ -110,6 +244,7 @@ class YouTubeDownloaderApp(ctk.CTk):
         selected_path = filedialog.askdirectory()
         if selected_path:
             self.download_path = selected_path
+            self._output_template = os.path.join(self.download_path, "%(title)s.%(ext)s")
             self.path_label.configure(text=f"Save to: {self.download_path}")
 
     def create_context_menu(self):
@@ -165,7 +300,9 @@ class YouTubeDownloaderApp(ctk.CTk):
     def fetch_playlist_titles(self, url):
         """Fetches video titles and URLs from a playlist using yt-dlp."""
         try:
-            command = ["yt-dlp", "--flat-playlist", "-j", url]
+            # --print asks yt-dlp for just the two fields we use, tab
+            # separated — no per-entry JSON is ever produced or parsed
+            command = [YT_DLP, "--flat-playlist", "--print", "%(title)s\t%(url)s", url]
             process = subprocess.Popen(
                 command,
                 stdout=subprocess.PIPE,
@@ -174,135 +311,286 @@ class YouTubeDownloaderApp(ctk.CTk):
                 universal_newlines=True
             )
 
-            self.video_info_list = []
-            for line in iter(process.stdout.readline, ''):
-                if line.strip():
-                    try:
-                        video_json = json.loads(line)
-                        self.video_info_list.append({
-                            'title': video_json['title'],
-                            'url': video_json['url']
-                        })
-                    except json.JSONDecodeError:
-                        # Ignore lines that are not valid JSON (e.g., yt-dlp warnings)
-                        pass
-            process.wait()
+            # Stream entries as yt-dlp prints them and hand each one to the
+            # main thread straight away, so the first rows appear while the
+            # rest of a long playlist is still being enumerated
+            for line in process.stdout:
+                # rpartition keeps titles containing tabs intact; warnings
+                # and other chatter carry no tab and are skipped
+                title, sep, video_url = line.rstrip('\n').rpartition('\t')
+                if not sep or not video_url:
+                    continue
+                video_info = {'title': title or 'Untitled Video', 'url': video_url}
+                self.after(0, self._append_video_row, video_info)
 
-            # Schedule display_videos to run on the main Tkinter thread
-            self.after(0, self.display_videos)
+            process.wait()
+            self.after(0, self._finish_playlist_load)
 
         except Exception as e:
             error_message = f"Failed to fetch playlist: {e}"
-            self.after(0, lambda msg=error_message: self.status_label.configure(text=msg))
-            self.after(0, lambda msg=error_message: messagebox.showerror("Error", msg))
+            self.after(0, partial(self.status_label.configure, text=error_message))
+            self.after(0, partial(messagebox.showerror, "Error", error_message))
         finally:
             self.is_fetching = False
-            self.after(0, lambda: self.load_button.configure(state=tk.NORMAL))
+            self.after(0, partial(self.load_button.configure, state=tk.NORMAL))
+
+    def _append_video_row(self, video_info):
+        """Adds one fetched video to the list; called per entry as the
+        playlist streams in, so early rows render before the fetch ends."""
+        row_index = len(self.video_info_list)
+        self.video_info_list.append(video_info)
+        video_url = video_info['url']
+
+        if row_index == 0:
+            self.status_label.configure(text="Loading videos...")
+            # Rows are laid out with grid: one geometry pass per row frame
+            # instead of one per packed widget
+            self.video_list_frame.grid_columnconfigure(0, weight=1)
+
+        # Frame for each video row
+        row_frame = ctk.CTkFrame(self.video_list_frame, fg_color="transparent")
+        row_frame.grid(row=row_index, column=0, sticky="ew", pady=2, padx=5)
+        row_frame.grid_columnconfigure(0, weight=1) # Title column absorbs spare width
+
+        # Video Title Label
+        ctk.CTkLabel(row_frame, text=video_info['title'], anchor="w", font=self.FONT_TITLE).grid(row=0, column=0, padx=5, sticky="ew")
+
+        # Status and progress are driven through Tk variables; writing
+        # the Var is one Tcl set and Tk redraws via its trace, which is
+        # cheaper than a configure()/set() call per update
+        status_var = ctk.StringVar(value="")
+        progress_var = ctk.DoubleVar(value=0.0)
+
+        # Status Label for individual video download
+        status_label = ctk.CTkLabel(row_frame, textvariable=status_var, fg_color="transparent", font=self.FONT_SM)
+        status_label.grid(row=0, column=1, padx=5)
+
+        # Progress Bar for individual video download
+        progress_bar = ctk.CTkProgressBar(row_frame, orientation="horizontal", width=150, variable=progress_var)
+        progress_bar.grid(row=0, column=2, padx=5)
+
+        # Audio Only Checkbox for each video
+        audio_only_video_var = ctk.BooleanVar(value=False)
+        audio_only_checkbox = ctk.CTkCheckBox(
+            row_frame,
+            text="MP3", # Shorter text for individual checkbox
+            variable=audio_only_video_var,
+            font=self.FONT_XS
+        )
+        audio_only_checkbox.grid(row=0, column=3, padx=5)
 
-    def display_videos(self):
-        """Displays fetched video titles with download options."""
+        # Cancel button for individual video
+        cancel_button = ctk.CTkButton(
+            row_frame,
+            text="Cancel",
+            command=lambda url=video_url: self.cancel_single_download(url),
+            state=tk.DISABLED,
+            fg_color="red",
+            hover_color="#c70000",
+            width=60,
+            font=self.FONT_SM_BOLD
+        )
+        cancel_button.grid(row=0, column=4, padx=5)
+
+        # Download button for individual video
+        download_button = ctk.CTkButton(
+            row_frame,
+            text="Download",
+            command=lambda url=video_url: self.start_single_download(url),
+            font=self.FONT_BTN,
+            width=100
+        )
+        download_button.grid(row=0, column=5, padx=5)
+
+        # Store references to widgets and their state variables
+        self.video_widgets[video_url] = {
+            'status_label': status_label,
+            'status_var': status_var,
+            'progress_bar': progress_bar,
+            'progress_var': progress_var,
+            'download_button': download_button,
+            'cancel_button': cancel_button,
+            'audio_only_var': audio_only_video_var, # Store the BooleanVar
+        }
+
+        # Let geometry and paint catch up once per batch of 10 rows
+        if row_index % 10 == 9:
+            self.video_list_frame.update_idletasks()
+
+    def _finish_playlist_load(self):
+        """Finalizes the list once yt-dlp has emitted every entry."""
         if self.video_info_list:
             self.status_label.configure(text=f"Found {len(self.video_info_list)} videos. Ready to download.")
-            self.download_all_button.configure(state=tk.NORMAL)
-            self.video_widgets.clear()
-            
-            for video_info in self.video_info_list:
-                video_url = video_info['url']
-                
-                # Frame for each video row
-                row_frame = ctk.CTkFrame(self.video_list_frame, fg_color="transparent")
-                row_frame.pack(fill=tk.X, pady=2, padx=5)
-
-                # Video Title Label
-                ctk.CTkLabel(row_frame, text=video_info['title'], anchor="w", font=("Arial", 12)).pack(side=tk.LEFT, padx=5, expand=True)
-
-                # Status Label for individual video download
-                status_label = ctk.CTkLabel(row_frame, text="", fg_color="transparent", font=("Arial", 10))
-                status_label.pack(side=tk.LEFT, padx=5)
-                
-                # Progress Bar for individual video download
-                progress_bar = ctk.CTkProgressBar(row_frame, orientation="horizontal", width=150)
-                progress_bar.set(0)
-                progress_bar.pack(side=tk.LEFT, padx=5)
-
-                # Audio Only Checkbox for each video
-                audio_only_video_var = ctk.BooleanVar(value=False)
-                audio_only_checkbox = ctk.CTkCheckBox(
-                    row_frame,
-                    text="MP3", # Shorter text for individual checkbox
-                    variable=audio_only_video_var,
-                    font=("Arial", 9)
-                )
-                audio_only_checkbox.pack(side=tk.LEFT, padx=5)
-
-                # Download button for individual video
-                download_button = ctk.CTkButton(
-                    row_frame,
-                    text="Download",
-                    command=lambda url=video_url: self.start_single_download(url),
-                    font=("Arial", 12, "bold"),
-                    width=100
-                )
-                download_button.pack(side=tk.RIGHT, padx=5)
-
-                # Cancel button for individual video
-                cancel_button = ctk.CTkButton(
-                    row_frame,
-                    text="Cancel",
-                    command=lambda url=video_url: self.cancel_single_download(url),
-                    state=tk.DISABLED,
-                    fg_color="red",
-                    hover_color="#c70000",
-                    width=60,
-                    font=("Arial", 10, "bold")
-                )
-                cancel_button.pack(side=tk.RIGHT, padx=5)
-                
-                # Store references to widgets and their state variables
-                self.video_widgets[video_url] = {
-                    'status_label': status_label,
-                    'progress_bar': progress_bar,
-                    'download_button': download_button,
-                    'cancel_button': cancel_button,
-                    'audio_only_var': audio_only_video_var, # Store the BooleanVar
-                }
+            self._set_global_buttons(dl_all_enabled=True, cancel_all_enabled=False)
         else:
             self.status_label.configure(text="No videos found in playlist.")
-            self.download_all_button.configure(state=tk.DISABLED)
+            self._set_global_buttons(dl_all_enabled=False, cancel_all_enabled=False)
+
+    def _on_close(self):
+        """Stops queued jobs and running downloads, then destroys the window."""
+        # Drop everything still queued behind the pool and don't wait for
+        # the workers; then signal the downloads that are already running
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for process in list(self.download_processes.values()):
+            _terminate_download(process)
+        self.destroy()
 
     def start_single_download(self, video_url):
         """Prepares and starts the download of a single video in a new thread."""
-        if video_url in self.download_processes: # Prevent double-clicking
+        if video_url in self.download_futures: # Prevent double-clicking (covers queued jobs too)
             return
         
         # Disable global download all and enable global cancel all
-        self.download_all_button.configure(state=tk.DISABLED)
-        self.cancel_all_button.configure(state=tk.NORMAL)
-        
+        self._active_download_count += 1
+        self._set_global_buttons(dl_all_enabled=False, cancel_all_enabled=True)
+
         widgets = self.video_widgets[video_url]
         widgets['download_button'].configure(state=tk.DISABLED)
         widgets['cancel_button'].configure(state=tk.NORMAL) # Enable cancel button
-        widgets['status_label'].configure(text="Starting...")
 
-        download_thread = threading.Thread(target=self.run_download, args=(video_url,), daemon=True)
-        download_thread.start()
+        # Revive the parked flush and monitor loops before output arrives
+        if not self._flush_running:
+            self._flush_running = True
+            self.after(100, self._flush_ui_updates)
+        if not self._monitor_running:
+            self._monitor_running = True
+            self.after(100, self.monitor_downloads)
+        widgets['status_var'].set("Starting...")
+        self._last_progress.pop(video_url, None) # Re-download starts fresh
+
+        self.download_futures[video_url] = self.executor.submit(self.run_download, video_url)
+
+    def _queue_ui_update(self, video_url, **updates):
+        """
+        Records the latest UI state for a video; _flush_ui_updates applies it.
+
+        Last-write-wins is exactly right for progress/status, but the
+        get-then-update below is a read-modify sequence, not a single atomic
+        setitem — without the lock a concurrent flush could pop the slot
+        between the two steps and the batch would land in an orphaned dict.
+        """
+        # get + explicit insert rather than setdefault: setdefault allocates
+        # a throwaway empty dict on every call, and this runs per output line
+        pending = self.pending_ui_updates
+        with self._pending_lock:
+            slot = pending.get(video_url)
+            if slot is None:
+                slot = pending[video_url] = {}
+            slot.update(updates)
+
+    def _flush_ui_updates(self):
+        """Applies all queued per-video UI updates in one 100ms tick."""
+        while True:
+            # Take the lock only to detach one slot; the Tcl work below
+            # happens with it released
+            with self._pending_lock:
+                if not self.pending_ui_updates:
+                    break
+                video_url, updates = self.pending_ui_updates.popitem()
+            widgets = self.video_widgets.get(video_url)
+            if not widgets:
+                continue # Row was cleared by a new playlist load
+            if 'progress' in updates:
+                widgets['progress_var'].set(updates['progress'])
+            if 'status' in updates:
+                widgets['status_var'].set(updates['status'])
+
+        # Keep ticking only while downloads can still produce updates;
+        # otherwise park until the next download restarts the loop. Gate on
+        # futures, not processes: a queued job has no process entry until
+        # its worker reaches Popen, and parking in that window would strand
+        # every update it later queues
+        if self.download_futures or self.pending_ui_updates:
+            self.after(100, self._flush_ui_updates)
+        else:
+            self._flush_running = False
+
+    def _handle_output_line(self, line, video_url, output_tail):
+        """Records one raw output line from yt-dlp and updates the row UI.
+
+        Takes the line as bytes — most lines never match anything and are
+        skipped without ever being decoded. Returns True if the line is a
+        success indicator, so the caller can track completion as output
+        streams by instead of re-scanning the accumulated output afterwards.
+        """
+        output_tail.append(line) # The deque evicts old lines automatically
+
+        # Cheap prefix check first: progress lines carry the fixed template
+        # prefix, so everything else skips progress parsing entirely
+        if line.startswith(PROGRESS_PREFIX):
+            pct_str, _, status = line[len(PROGRESS_PREFIX):].partition(b'|')
+            status = status.strip()
+            try:
+                # yt-dlp emits 'NA' for the percent before it is known
+                pct = float(pct_str.decode('ascii', 'replace'))
+            except ValueError:
+                self._queue_ui_update(video_url, status=status.decode('utf-8', 'replace').capitalize())
+            else:
+                progress = pct / 100.0
+                # Fractional-percent ticks don't visibly move the bar;
+                # drop anything under a 1% change short of completion
+                if abs(progress - self._last_progress.get(video_url, -1.0)) >= 0.01 or progress >= 1.0:
+                    self._last_progress[video_url] = progress
+                    self._queue_ui_update(
+                        video_url,
+                        progress=progress,
+                        status=f"[download] {pct:.1f}%"
+                    )
+            return status == b'finished'
+
+        if KEYWORD_REGEX.search(line):
+            # Errors, warnings and destination/merge notices are worth
+            # showing; the rest is yt-dlp chatter — and is never decoded
+            self._queue_ui_update(video_url, status=line.decode('utf-8', 'replace').strip())
+        return line.startswith(b'[') and any(token in line for token in SUCCESS_TOKENS)
+
+    def _finish_cancelled_future(self, video_url):
+        """Resets the row UI for a job cancelled before its future ever ran.
+
+        Runs on the main thread. A cancelled future never reaches
+        run_download's finally block, so its bookkeeping happens here.
+        """
+        self.download_futures.pop(video_url, None)
+        widgets = self.video_widgets.get(video_url)
+        if widgets:
+            widgets['download_button'].configure(state=tk.NORMAL)
+            widgets['cancel_button'].configure(state=tk.DISABLED)
+            widgets['status_var'].set("Cancelled")
+            widgets['progress_var'].set(0)
+        self._on_download_finished()
 
     def run_download(self, video_url):
         """Executes the yt-dlp command for a single video."""
-        widgets = self.video_widgets[video_url]
-        full_output = [] # To store all lines from yt-dlp for final analysis
-        
+        widgets = self.video_widgets.get(video_url)
+        if widgets is None:
+            # A new playlist load cleared this row while the job sat queued
+            # behind the pool; nothing to download into, but the counter
+            # still has to come back down
+            self.download_futures.pop(video_url, None)
+            self.after(0, self._on_download_finished)
+            return
+        # Success is detected per line as output streams; the bounded tail
+        # exists only to show something useful when a download fails
+        full_output = deque(maxlen=40)
+        success_seen = False
+
         try:
-            # Base command arguments
-            command = ["yt-dlp", "--progress"]
+            # Base command arguments; the progress template replaces yt-dlp's
+            # human-readable progress lines with ones built for parsing.
+            # --no-part and --no-mtime skip the .part rename and utime call
+            # per file, and --no-playlist pins single-video behavior for
+            # URLs that also carry a playlist parameter.
+            command = [
+                YT_DLP, "--newline", "--progress-template", PROGRESS_TEMPLATE,
+                "--no-part", "--no-mtime", "--no-playlist",
+            ]
             
             # Add output template with selected path
-            output_template = os.path.join(self.download_path, "%(title)s.%(ext)s")
-            command.extend(["-o", output_template])
+            command.extend(["-o", self._output_template])
 
             # Check if audio-only is selected for THIS video
             if widgets['audio_only_var'].get():
-                command.extend(["--extract-audio", "--audio-format", "mp3", "--no-playlist"])
+                command.extend(["--extract-audio", "--audio-format", "mp3"])
             
             command.append(video_url) # Add the video URL last
 
@@ -310,113 +598,120 @@ class YouTubeDownloaderApp(ctk.CTk):
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT, # Merge stdout and stderr for simpler parsing
-                text=True,
-                bufsize=1, # Line-buffered output
-                universal_newlines=True
+                **_DOWNLOAD_SPAWN_KWARGS
             )
             self.download_processes[video_url] = process
-            
-            # Read output in a loop to update progress
-            progress_regex = re.compile(r'\[download\]\s+(\d+(?:\.\d+)?)%')
-            
+
+            # Drain the pipe in 64KB binary chunks and split lines here. Text
+            # mode with bufsize=1 would push every byte through Python's
+            # incremental decoder and cost a readline call per output line;
+            # this way lines stay as bytes and are only decoded if shown.
+            fd = process.stdout.fileno()
+            residual = b''
+            # Bind the per-iteration lookups to locals; global and method
+            # lookups add up over the many lines a long download produces
+            read = os.read
+            handle_line = self._handle_output_line
             while True:
-                line = process.stdout.readline()
-                if not line: # No more output
+                chunk = read(fd, 65536)
+                if not chunk: # EOF: the process closed its end of the pipe
+                    if residual:
+                        success_seen |= handle_line(residual, video_url, full_output)
                     break
-                
-                full_output.append(line) # Store every line
-
-                # Check if process terminated early (e.g., cancelled)
-                if process.poll() is not None and not line.strip(): 
-                    break # Exit if process is done and no more output
-
-                match = progress_regex.search(line)
-                if match:
-                    try:
-                        percentage = float(match.group(1)) / 100.0
-                        self.after(0, lambda p=percentage, w=widgets: w['progress_bar'].set(p))
-                        self.after(0, lambda text=line.strip(), w=widgets: w['status_label'].configure(text=text))
-                    except (ValueError, IndexError):
-                        self.after(0, lambda text=line.strip(), w=widgets: w['status_label'].configure(text=text))
-                else:
-                    self.after(0, lambda text=line.strip(), w=widgets: w['status_label'].configure(text=text))
-            
+                residual += chunk
+                raw_lines = residual.split(b'\n')
+                residual = raw_lines.pop() # Keep any incomplete trailing line
+                for raw_line in raw_lines:
+                    success_seen |= handle_line(raw_line, video_url, full_output)
+
             process.wait() # Wait for the subprocess to truly complete
 
             # --- FINAL STATUS DETERMINATION ---
-            is_success = False
-            combined_output_str = "".join(full_output)
+            # Success indicators were collected while the output streamed, so
+            # a non-zero exit (e.g. yt-dlp warnings after a completed
+            # download) needs no re-scan of the output here
+            is_success = process.returncode == 0 or success_seen
 
-            if process.returncode == 0:
-                is_success = True
-            else:
-                # Even if returncode is non-zero, check for success indicators in output
-                # This handles cases where yt-dlp exits with warnings but completes successfully
-                if (re.search(r'\[download\] 100%', combined_output_str) or # Explicit 100% download
-                    re.search(r'\[ExtractAudio\] Destination:', combined_output_str) or # Audio extracted
-                    re.search(r'\[ffmpeg\] Destination:', combined_output_str) or     # ffmpeg conversion/merge
-                    re.search(r'\[Merger\] Merging formats into', combined_output_str)): # Video/audio merged
-                    is_success = True
-            
-            # Update UI on the main thread based on final determination
+            # Queue the final state; going through the same channel as the
+            # per-line updates keeps ordering with any still-pending ones
             if is_success:
-                self.after(0, lambda w=widgets: w['status_label'].configure(text="Download Completed!"))
-                self.after(0, lambda w=widgets: w['progress_bar'].set(1.0)) # Ensure 100%
+                self._queue_ui_update(video_url, status="Download Completed!", progress=1.0)
             else:
-                error_message = combined_output_str.strip()
+                # The tail is only decoded here, on the failure path
+                error_message = b"\n".join(full_output).decode('utf-8', 'replace').strip()
                 if not error_message: # Fallback if output is empty
                     error_message = f"Unknown error (Exit Code: {process.returncode})"
-                self.after(0, lambda w=widgets, e_msg=error_message: w['status_label'].configure(text=f"Download Failed! {e_msg}"))
-                self.after(0, lambda w=widgets: w['progress_bar'].set(0)) # Reset or show failed state
+                self._queue_ui_update(video_url, status=f"Download Failed! {error_message}", progress=0)
 
         except Exception as e:
-            self.after(0, lambda w=widgets, error_msg=e: w['status_label'].configure(text=f"Error: {error_msg}"))
+            self._queue_ui_update(video_url, status=f"Error: {e}")
         finally:
-            # Cleanup and reset UI for this specific video
-            if video_url in self.download_processes:
-                del self.download_processes[video_url]
+            # Cleanup and reset UI for this specific video; pop hashes the
+            # key once where the membership check plus del hashed it twice
+            self.download_processes.pop(video_url, None)
+            self.download_futures.pop(video_url, None)
             
-            self.after(0, lambda w=widgets: w['download_button'].configure(state=tk.NORMAL))
-            self.after(0, lambda w=widgets: w['cancel_button'].configure(state=tk.DISABLED))
+            # partial binds the target at creation time like the w=widgets
+            # default did, without allocating a closure cell per callback
+            self.after(0, partial(widgets['download_button'].configure, state=tk.NORMAL))
+            self.after(0, partial(widgets['cancel_button'].configure, state=tk.DISABLED))
             
             # Check if all downloads are complete to re-enable global download_all
-            self.after(0, self._check_global_buttons_state)
+            self.after(0, self._on_download_finished)
 
 
     def download_all(self):
         """Starts downloading all videos in the loaded playlist."""
-        self.download_all_button.configure(state=tk.DISABLED)
-        self.cancel_all_button.configure(state=tk.NORMAL)
-        
+        self._set_global_buttons(dl_all_enabled=False, cancel_all_enabled=True)
+
+
         for video_info in self.video_info_list:
             video_url = video_info['url']
-            # Only start if not already downloading
-            if video_url not in self.download_processes:
+            # Only start if not already queued or downloading
+            if video_url not in self.download_futures:
                 self.start_single_download(video_url)
 
     def cancel_single_download(self, video_url):
         """Terminates the subprocess for a specific video download."""
-        if video_url in self.download_processes:
-            process = self.download_processes[video_url]
-            process.terminate() # Send termination signal
+        # A job still queued behind the pool has no subprocess; cancelling
+        # its future stops it from ever spawning yt-dlp
+        future = self.download_futures.get(video_url)
+        if future is not None and future.cancel():
+            self._finish_cancelled_future(video_url)
+            return
+
+        process = self.download_processes.get(video_url)
+        if process is not None:
+            _terminate_download(process) # Signals the whole process group on POSIX
+            # A download mid-write can shrug off SIGTERM; follow up with
+            # SIGKILL if it is still alive in two seconds
+            self.after(2000, partial(_force_kill_download, process))
             # The run_download's finally block will handle cleanup and UI reset
             widgets = self.video_widgets[video_url]
-            self.after(0, lambda w=widgets: w['status_label'].configure(text="Cancelling...")) # Immediate feedback
-            self.after(0, lambda w=widgets: w['progress_bar'].set(0)) # Reset progress bar immediately
+            self.after(0, partial(widgets['status_var'].set, "Cancelling...")) # Immediate feedback
+            self.after(0, partial(widgets['progress_var'].set, 0)) # Reset progress bar immediately
 
     def cancel_all(self):
         """Terminates all active download subprocesses."""
         self.status_label.configure(text="Cancelling all downloads...")
-        
+        self._status_is_cancelling = True
+
+        # Queued jobs first: a cancelled future never spawns its yt-dlp
+        # process, so a large playlist stops instead of draining the queue
+        for video_url, future in list(self.download_futures.items()):
+            if future.cancel():
+                self._finish_cancelled_future(video_url)
+
         # Create a list of keys to avoid RuntimeError: dictionary changed size during iteration
         keys_to_terminate = list(self.download_processes.keys())
         for video_url in keys_to_terminate:
             process = self.download_processes[video_url]
-            process.terminate()
+            _terminate_download(process)
+            self.after(2000, partial(_force_kill_download, process))
             # The run_download's finally block for each video will handle its cleanup.
             widgets = self.video_widgets[video_url]
-            self.after(0, lambda w=widgets: w['status_label'].configure(text="Cancelling...")) # Immediate feedback
-            self.after(0, lambda w=widgets: w['progress_bar'].set(0)) # Reset progress bar immediately
+            self.after(0, partial(widgets['status_var'].set, "Cancelling...")) # Immediate feedback
+            self.after(0, partial(widgets['progress_var'].set, 0)) # Reset progress bar immediately
 
         # Global buttons will be reset by _check_global_buttons_state once all processes terminate
 
@@ -428,23 +723,42 @@ class YouTubeDownloaderApp(ctk.CTk):
         # We just need to check if there are any processes left to decide global button state
         self._check_global_buttons_state()
 
-        # Reschedule the next check
-        self.after(100, self.monitor_downloads)
+        # Adaptive cadence: tight while downloads run, barely ticking while
+        # the window is minimized, and parked entirely when idle — an idle
+        # GUI schedules no monitor timer at all
+        if self.state() == 'iconic':
+            self.after(5000, self.monitor_downloads)
+        elif self.download_processes or self._active_download_count:
+            self.after(100, self.monitor_downloads)
+        else:
+            self._monitor_running = False
+
+    def _set_global_buttons(self, dl_all_enabled, cancel_all_enabled):
+        """Applies global button states, touching Tcl only on actual change."""
+        if dl_all_enabled != self._dl_all_enabled:
+            self.download_all_button.configure(state=tk.NORMAL if dl_all_enabled else tk.DISABLED)
+            self._dl_all_enabled = dl_all_enabled
+        if cancel_all_enabled != self._cancel_all_enabled:
+            self.cancel_all_button.configure(state=tk.NORMAL if cancel_all_enabled else tk.DISABLED)
+            self._cancel_all_enabled = cancel_all_enabled
+
+    def _on_download_finished(self):
+        """Runs on the main thread once per finished download."""
+        self._active_download_count -= 1
+        self._check_global_buttons_state()
 
     def _check_global_buttons_state(self):
         """Helper to enable/disable global Download All/Cancel All buttons."""
-        active_cancels = any(
-            widgets['cancel_button'].cget("state") == tk.NORMAL for widgets in self.video_widgets.values()
-        )
-        if not self.download_processes and not active_cancels: # No active downloads
-            self.download_all_button.configure(state=tk.NORMAL)
-            self.cancel_all_button.configure(state=tk.DISABLED)
+        # Derived entirely from Python-side counters — no cget round-trips
+        # through Tcl per check
+        if self._active_download_count == 0 and not self.download_processes:
+            self._set_global_buttons(dl_all_enabled=True, cancel_all_enabled=False)
             # Only change global status label if it's currently showing "Cancelling..."
-            if self.status_label.cget("text").startswith("Cancelling"):
+            if self._status_is_cancelling:
                 self.status_label.configure(text="All downloads finished or cancelled.")
+                self._status_is_cancelling = False
         else:
-            self.download_all_button.configure(state=tk.DISABLED)
-            self.cancel_all_button.configure(state=tk.NORMAL)
+            self._set_global_buttons(dl_all_enabled=False, cancel_all_enabled=True)
 
 
 if __name__ == "__main__":
@@ -13,40 +13,81 @@ Core Functions:
 import subprocess
 import os
 import re
+import select
+import time
+from functools import lru_cache
 from typing import Optional, Callable, Dict, Any
 
+# select() works on pipe descriptors only on POSIX; elsewhere the read loop
+# falls back to plain blocking reads
+_PIPE_SELECT = os.name == 'posix'
 
-def _build_ytdlp_command(
-    video_url: str,
-    download_path: str,
-    extract_audio: bool = False
-) -> list:
+# Progress lines look like "[download]  42.5% of ..."; compiled once at
+# import rather than per download_video() call
+_PROGRESS_RE = re.compile(r'\[download\]\s+(\d+(?:\.\d+)?)%')
+
+# Success indicators that may appear in the output even when yt-dlp exits
+# non-zero. One alternation means _determine_success scans the output a
+# single time instead of once per pattern.
+_SUCCESS_RE = re.compile(
+    r'\[download\] 100%'                 # Explicit 100% download
+    r'|\[ExtractAudio\] Destination:'    # Audio extracted successfully
+    r'|\[ffmpeg\] Destination:'          # ffmpeg conversion/merge completed
+    r'|\[Merger\] Merging formats into'  # Video/audio merge completed
+    r'|has already been downloaded'      # File already exists (success case)
+)
+
+
+@lru_cache(maxsize=16)
+def _ytdlp_command_prefix(download_path: str, extract_audio: bool) -> tuple:
     """
-    Build yt-dlp command arguments based on download options.
-    
+    Build the constant part of the yt-dlp command for a given configuration.
+
+    Everything except the video URL depends only on (download_path,
+    extract_audio), so the assembled prefix is memoized — repeated downloads
+    into the same folder reuse one tuple instead of rebuilding the list and
+    output template each call.
+
     Args:
-        video_url: The URL of the video to download
         download_path: Directory path where the file will be saved
         extract_audio: If True, extract audio as MP3; if False, download video
-    
+
     Returns:
-        List of command arguments for subprocess execution
+        Tuple of command arguments, missing only the video URL
     """
     command = ["yt-dlp", "--progress"]
-    
+
     # Set output template with download path
     output_template = os.path.join(download_path, "%(title)s.%(ext)s")
     command.extend(["-o", output_template])
-    
+
     # Add format selection or audio extraction flags
     if extract_audio:
         command.extend(["--extract-audio", "--audio-format", "mp3", "--no-playlist"])
     else:
         # Use best video format with mp4 extension
         command.extend(["-f", "best[ext=mp4]"])
-    
-    command.append(video_url)
-    return command
+
+    return tuple(command)
+
+
+def _build_ytdlp_command(
+    video_url: str,
+    download_path: str,
+    extract_audio: bool = False
+) -> list:
+    """
+    Build yt-dlp command arguments based on download options.
+
+    Args:
+        video_url: The URL of the video to download
+        download_path: Directory path where the file will be saved
+        extract_audio: If True, extract audio as MP3; if False, download video
+
+    Returns:
+        List of command arguments for subprocess execution
+    """
+    return [*_ytdlp_command_prefix(download_path, extract_audio), video_url]
 
 
 def download_video(
@@ -67,7 +108,10 @@ def download_video(
         video_url: The URL of the video to download
         download_path: Directory path where the file will be saved
         extract_audio: If True, extract audio as MP3; if False, download video (default: False)
-        progress_callback: Optional callback function that receives progress text lines
+        progress_callback: Optional callback that receives batches of progress
+            text lines joined with newlines. yt-dlp bursts output (format
+            lists, warnings), so lines are coalesced and flushed at most every
+            50 ms — or every 32 lines — keeping GUI main-thread wakeups rare.
         cancel_check: Optional callback that returns True if download should be cancelled
     
     Returns:
@@ -90,27 +134,32 @@ def download_video(
         >>> if result['success']:
         ...     print("Download completed!")
     """
-    full_output = []
+    full_output = bytearray()
     process = None
-    
+
     try:
         # Build command based on options
         command = _build_ytdlp_command(video_url, download_path, extract_audio)
-        
-        # Start subprocess
+
+        # Start subprocess. Output stays binary: chunked reads into one
+        # buffer avoid a syscall, a str allocation and a UTF-8 decode per
+        # line, and the buffer is decoded exactly once at the end.
+        # Keep the child setup default (no preexec_fn/pass_fds) so CPython
+        # launches via posix_spawn instead of fork+exec; stdin goes to
+        # DEVNULL explicitly rather than being inherited.
         process = subprocess.Popen(
             command,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,  # Merge stderr into stdout
-            text=True,
-            bufsize=1,  # Line-buffered output
-            universal_newlines=True
+            close_fds=True
         )
-        
-        # Progress regex pattern to detect download percentage
-        progress_regex = re.compile(r'\[download\]\s+(\d+(?:\.\d+)?)%')
-        
-        # Stream output line by line
+        fd = process.stdout.fileno()
+        scan_pos = 0  # How far full_output has been scanned for complete lines
+        pending_lines = []  # Lines awaiting a coalesced callback flush
+        last_flush = time.monotonic()
+
+        # Stream output in chunks
         while True:
             # Check if caller requested cancellation
             if cancel_check and cancel_check():
@@ -120,28 +169,52 @@ def download_video(
                     'success': False,
                     'process': process,
                     'error_message': 'Download cancelled by user',
-                    'output': ''.join(full_output)
+                    'output': full_output.decode('utf-8', errors='replace')
                 }
-            
-            line = process.stdout.readline()
-            if not line:  # No more output
+
+            if _PIPE_SELECT:
+                # Bounded wait keeps cancellation responsive even when
+                # yt-dlp goes quiet during a network stall
+                ready, _, _ = select.select([fd], [], [], 0.2)
+                if not ready:
+                    if process.poll() is not None:
+                        break
+                    continue
+
+            chunk = os.read(fd, 8192)
+            if not chunk:  # No more output
                 break
-            
-            full_output.append(line)
-            
-            # Invoke progress callback if provided
+            full_output += chunk
+
+            # Collect complete lines; flush them to the callback in batches
             if progress_callback:
-                progress_callback(line.strip())
-            
-            # Check if process terminated early
-            if process.poll() is not None and not line.strip():
-                break
-        
+                newline = full_output.find(b'\n', scan_pos)
+                while newline != -1:
+                    line = full_output[scan_pos:newline].decode('utf-8', errors='replace')
+                    pending_lines.append(line.strip())
+                    scan_pos = newline + 1
+                    newline = full_output.find(b'\n', scan_pos)
+
+                now = time.monotonic()
+                if pending_lines and (len(pending_lines) >= 32 or now - last_flush > 0.05):
+                    progress_callback('\n'.join(pending_lines))
+                    pending_lines.clear()
+                    last_flush = now
+
+        # Deliver any batched lines plus a trailing partial line
+        if progress_callback:
+            if scan_pos < len(full_output):
+                pending_lines.append(
+                    full_output[scan_pos:].decode('utf-8', errors='replace').strip()
+                )
+            if pending_lines:
+                progress_callback('\n'.join(pending_lines))
+
         # Wait for process to complete
         process.wait()
-        
+
         # Determine success based on return code and output patterns
-        combined_output = ''.join(full_output)
+        combined_output = full_output.decode('utf-8', errors='replace')
         is_success = _determine_success(process.returncode, combined_output)
         
         if is_success:
@@ -173,7 +246,7 @@ def download_video(
             'success': False,
             'process': process,
             'error_message': f"Download error: {str(e)}",
-            'output': ''.join(full_output)
+            'output': full_output.decode('utf-8', errors='replace')
         }
 
 
@@ -193,21 +266,9 @@ def _determine_success(return_code: int, output: str) -> bool:
     """
     if return_code == 0:
         return True
-    
+
     # Check for success indicators even with non-zero return code
-    success_patterns = [
-        r'\[download\] 100%',                      # Explicit 100% download
-        r'\[ExtractAudio\] Destination:',          # Audio extracted successfully
-        r'\[ffmpeg\] Destination:',                # ffmpeg conversion/merge completed
-        r'\[Merger\] Merging formats into',        # Video/audio merge completed
-        r'has already been downloaded'             # File already exists (success case)
-    ]
-    
-    for pattern in success_patterns:
-        if re.search(pattern, output):
-            return True
-    
-    return False
+    return bool(_SUCCESS_RE.search(output))
 
 
 def cancel_download(process_handle: subprocess.Popen) -> bool:
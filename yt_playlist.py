@@ -13,53 +13,121 @@ Core Functions:
 
 import subprocess
 import json
-from typing import Dict, Any, List, Optional
+import re
+from typing import Dict, Any, List, NamedTuple, Optional
+
+try:
+    # orjson decodes the per-entry JSON several times faster than the
+    # stdlib parser; entirely optional, json covers its absence
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Constant part of the fetch command; only the URL varies per call
+_PLAYLIST_COMMAND_PREFIX = ("yt-dlp", "--flat-playlist", "-j")
+
+# Classify stderr in a single scan: the named group that matched tells us
+# which user-facing message to return, instead of chaining substring tests
+# (each with its own .lower() pass) over the whole output
+_ERROR_CLASSIFY_RE = re.compile(
+    r'(?P<private>Private video|private)'
+    r'|(?P<unavailable>Video unavailable|unavailable)'
+    r'|(?P<network>network|connection)',
+    re.IGNORECASE
+)
+
+_ERROR_MESSAGES = {
+    'private': 'Playlist or video is private or unavailable',
+    'unavailable': 'Video or playlist is unavailable',
+    'network': 'Network error: Unable to connect to YouTube',
+}
+
+
+class VideoEntry(NamedTuple):
+    """
+    One parsed playlist entry.
+
+    A fixed-slot tuple instead of a per-video dict: roughly a third of the
+    memory and C-level attribute access, which adds up across
+    thousand-entry playlists. Call ._asdict() where a plain dict is needed.
+    """
+    title: str
+    url: str
+    webpage_url: str
+    uploader: str
+    duration: Optional[int]
+
+
+def _fail(error_message: str) -> Dict[str, Any]:
+    """
+    Build the standard failure result returned by fetch_playlist_info.
+
+    Every error path returns the same shape with only the message varying,
+    so it is constructed in exactly one place.
+
+    Args:
+        error_message: Human-readable description of the failure
+
+    Returns:
+        Failure result dictionary with empty playlist fields
+    """
+    return {
+        'success': False,
+        'title': '',
+        'videos': [],
+        'video_count': 0,
+        'error_message': error_message
+    }
 
 
 def _build_playlist_command(playlist_url: str) -> list:
     """
     Build yt-dlp command arguments for fetching playlist metadata.
-    
+
     Uses --flat-playlist to fetch metadata without downloading, and -j for JSON output.
-    
+
     Args:
         playlist_url: The URL of the playlist or video to fetch
-    
+
     Returns:
         List of command arguments for subprocess execution
     """
-    return ["yt-dlp", "--flat-playlist", "-j", playlist_url]
+    return [*_PLAYLIST_COMMAND_PREFIX, playlist_url]
 
 
-def _parse_video_entry(video_json: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def _parse_video_entry(video_json: Dict[str, Any]) -> Optional[VideoEntry]:
     """
     Extract relevant video information from a yt-dlp JSON entry.
-    
+
     Args:
         video_json: Raw JSON object from yt-dlp output
-    
+
     Returns:
-        Dictionary containing extracted video information, or None if parsing fails
+        VideoEntry with the extracted video information, or None if parsing fails
     """
-    try:
-        video_info = {
-            'title': video_json.get('title', 'Unknown Title'),
-            'url': video_json.get('url', ''),
-            'webpage_url': video_json.get('webpage_url', video_json.get('url', '')),
-            'uploader': video_json.get('uploader', video_json.get('channel', 'Unknown')),
-            'duration': video_json.get('duration', None)
-        }
-        
-        # Validate that we at least have a URL
-        if not video_info['url']:
-            return None
-            
-        return video_info
-    except (KeyError, TypeError):
+    # dict.get never raises, so an upfront type check replaces the old
+    # try/except; the bound .get skips an attribute lookup per field
+    if not isinstance(video_json, dict):
+        return None
+
+    g = video_json.get
+
+    # Validate that we at least have a URL
+    url = g('url', '')
+    if not url:
         return None
 
+    return VideoEntry(
+        title=g('title', 'Unknown Title'),
+        url=url,
+        webpage_url=g('webpage_url') or url,
+        uploader=g('uploader') or g('channel') or 'Unknown',
+        duration=g('duration')
+    )
+
 
-def _extract_playlist_title(videos_data: List[Dict[str, Any]], first_json: Dict[str, Any]) -> str:
+def _extract_playlist_title(videos_data: List[VideoEntry], first_json: Dict[str, Any]) -> str:
     """
     Extract playlist title from available data.
     
@@ -79,7 +147,7 @@ def _extract_playlist_title(videos_data: List[Dict[str, Any]], first_json: Dict[
     
     # If still no title and we have videos, use first video's title
     if not playlist_title and videos_data:
-        playlist_title = videos_data[0].get('title', 'Unknown Playlist')
+        playlist_title = videos_data[0].title
     
     # Final fallback
     if not playlist_title:
@@ -103,12 +171,12 @@ def fetch_playlist_info(playlist_url: str) -> Dict[str, Any]:
         Dictionary containing:
             - 'success' (bool): True if playlist was fetched successfully
             - 'title' (str): Playlist title or video title for single videos
-            - 'videos' (list): List of video dictionaries with keys:
-                - 'title': Video title
-                - 'url': Video URL/ID
-                - 'webpage_url': Full YouTube URL
-                - 'uploader': Channel name
-                - 'duration': Video duration in seconds (may be None)
+            - 'videos' (list): List of VideoEntry tuples with fields:
+                - title: Video title
+                - url: Video URL/ID
+                - webpage_url: Full YouTube URL
+                - uploader: Channel name
+                - duration: Video duration in seconds (may be None)
             - 'video_count' (int): Total number of videos found
             - 'error_message' (str): Error description if success is False
     
@@ -118,7 +186,7 @@ def fetch_playlist_info(playlist_url: str) -> Dict[str, Any]:
         ...     print(f"Playlist: {result['title']}")
         ...     print(f"Videos: {result['video_count']}")
         ...     for video in result['videos']:
-        ...         print(f"  - {video['title']}")
+        ...         print(f"  - {video.title}")
     
     Error Handling:
         - Returns success=False for invalid URLs
@@ -127,13 +195,7 @@ def fetch_playlist_info(playlist_url: str) -> Dict[str, Any]:
         - Returns success=False if yt-dlp is not installed
     """
     if not playlist_url or not playlist_url.strip():
-        return {
-            'success': False,
-            'title': '',
-            'videos': [],
-            'video_count': 0,
-            'error_message': 'Invalid URL: URL cannot be empty'
-        }
+        return _fail('Invalid URL: URL cannot be empty')
     
     videos_data = []
     first_json = {}
@@ -142,13 +204,17 @@ def fetch_playlist_info(playlist_url: str) -> Dict[str, Any]:
         # Build command
         command = _build_playlist_command(playlist_url.strip())
         
-        # Execute yt-dlp
+        # Execute yt-dlp. Default child setup (no preexec_fn/pass_fds) keeps
+        # CPython on the cheap posix_spawn launch path, which matters for
+        # short metadata-only calls like this one.
         process = subprocess.Popen(
             command,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
-            universal_newlines=True
+            universal_newlines=True,
+            close_fds=True
         )
         
         # Parse output line by line
@@ -157,8 +223,8 @@ def fetch_playlist_info(playlist_url: str) -> Dict[str, Any]:
                 continue
             
             try:
-                video_json = json.loads(line.strip())
-                
+                video_json = _json_loads(line)
+
                 # Store first JSON for playlist metadata
                 if not first_json:
                     first_json = video_json
@@ -168,8 +234,9 @@ def fetch_playlist_info(playlist_url: str) -> Dict[str, Any]:
                 if video_info:
                     videos_data.append(video_info)
                     
-            except json.JSONDecodeError:
-                # Ignore lines that are not valid JSON (warnings, errors, etc.)
+            except ValueError:
+                # Ignore lines that are not valid JSON (warnings, errors,
+                # etc.); ValueError covers both parsers
                 continue
         
         # Wait for process to complete
@@ -180,52 +247,21 @@ def fetch_playlist_info(playlist_url: str) -> Dict[str, Any]:
         
         # Check for errors
         if return_code != 0:
-            # Check for common error patterns in stderr
+            # Classify common error patterns in stderr with one regex scan
             error_message = stderr_output.strip()
-            
-            if 'Private video' in error_message or 'private' in error_message.lower():
-                return {
-                    'success': False,
-                    'title': '',
-                    'videos': [],
-                    'video_count': 0,
-                    'error_message': 'Playlist or video is private or unavailable'
-                }
-            elif 'Video unavailable' in error_message or 'unavailable' in error_message.lower():
-                return {
-                    'success': False,
-                    'title': '',
-                    'videos': [],
-                    'video_count': 0,
-                    'error_message': 'Video or playlist is unavailable'
-                }
-            elif 'network' in error_message.lower() or 'connection' in error_message.lower():
-                return {
-                    'success': False,
-                    'title': '',
-                    'videos': [],
-                    'video_count': 0,
-                    'error_message': 'Network error: Unable to connect to YouTube'
-                }
-            else:
+            match = _ERROR_CLASSIFY_RE.search(error_message)
+
+            if match:
+                error_message = _ERROR_MESSAGES[match.lastgroup]
+            elif not error_message:
                 # Generic error
-                return {
-                    'success': False,
-                    'title': '',
-                    'videos': [],
-                    'video_count': 0,
-                    'error_message': error_message or f'Failed to fetch playlist (exit code: {return_code})'
-                }
+                error_message = f'Failed to fetch playlist (exit code: {return_code})'
+
+            return _fail(error_message)
         
         # Check if we got any videos
         if not videos_data:
-            return {
-                'success': False,
-                'title': '',
-                'videos': [],
-                'video_count': 0,
-                'error_message': 'No videos found in playlist or invalid URL'
-            }
+            return _fail('No videos found in playlist or invalid URL')
         
         # Extract playlist title
         playlist_title = _extract_playlist_title(videos_data, first_json)
@@ -240,19 +276,7 @@ def fetch_playlist_info(playlist_url: str) -> Dict[str, Any]:
         }
     
     except FileNotFoundError:
-        return {
-            'success': False,
-            'title': '',
-            'videos': [],
-            'video_count': 0,
-            'error_message': 'yt-dlp not found. Please ensure yt-dlp is installed and in PATH.'
-        }
-    
+        return _fail('yt-dlp not found. Please ensure yt-dlp is installed and in PATH.')
+
     except Exception as e:
-        return {
-            'success': False,
-            'title': '',
-            'videos': [],
-            'video_count': 0,
-            'error_message': f'Unexpected error: {str(e)}'
-        }
+        return _fail(f'Unexpected error: {str(e)}')